@@ -8,14 +8,13 @@ package com.mypalmike.retraction;
 DecNum     : [0-9]+;
 HexNum     : '$'[0-9A-F]+;
 CharLit    : '\''.;
-Identifier : [A-Z][A-Z_0-9]*;
-DblQuote   : '"';
-String     : '"'.*'"';
+String     : '"' ('""' | ~["\r\n])* '"';
 And        : 'AND';
 Or         : 'OR';
 Xor        : 'XOR';
 Lsh        : 'LSH';
 Rsh        : 'RSH';
+Mod        : 'MOD';
 Ampersand  : '&';
 Percent    : '%';
 Bang       : '!';
@@ -46,8 +45,10 @@ LParen     : '(';
 RParen     : ')';
 Caret      : '^';
 Dot        : '.';
+Module     : 'MODULE';
 Return     : 'RETURN';
 Proc       : 'PROC';
+Func       : 'FUNC';
 Exit       : 'EXIT';
 If         : 'IF';
 Then       : 'THEN';
@@ -56,10 +57,14 @@ ElseIf     : 'ELSEIF';
 Fi         : 'FI';
 Do         : 'DO';
 Until      : 'UNTIL';
+While      : 'WHILE';
 Od         : 'OD';
 For        : 'FOR';
 To         : 'TO';
 Step       : 'STEP';
+Identifier : [A-Z][A-Z_0-9]*;
+Comment    : ';' ~[\r\n]* -> skip;
+WS         : [ \t\r\n]+ -> skip;
 
 
 program
@@ -260,7 +265,7 @@ funcRoutine
     ;
 
 funcDecl
-    : fundType Func identifier (Equals funcAddr)? LParent (paramDecl)? RParen
+    : fundType Func identifier (Equals funcAddr)? LParen (paramDecl)? RParen
     ;
     
 funcAddr
@@ -273,11 +278,11 @@ routineCall
     ;
 
 procCall
-    : identifier LParam (paramDecl) RParam
+    : identifier LParen (paramDecl) RParen
     ;
 
 funcCall
-    : identifier LParam (paramDecl) RParam
+    : identifier LParen (paramDecl) RParen
     ;
     
 paramDecl
@@ -320,7 +325,7 @@ ifStmt
     ;
 
 elseifExten
-    : Elseif condExp Then (stmtList)?
+    : ElseIf condExp Then (stmtList)?
     ;
     
 elseExten
@@ -423,10 +428,6 @@ baseCompConst
 identifier
     : Identifier
     ;
-    
-// stringConst
-//    : DblQuote String DblQuote
-//   ;
 
 specialOp
     : And
@@ -440,7 +441,7 @@ relOp
     | Bang
     | Equals
     | Pound
-    | NotEquals
+    | NotEqual
     | Lt
     | LtEq
     | Gt
@@ -454,7 +455,7 @@ addOp
     
 multOp
     : Times
-    | Divide
+    | Div
     | Mod
     | Lsh
     | Rsh